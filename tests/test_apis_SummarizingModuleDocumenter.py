@@ -342,3 +342,16 @@ def test_str_03(test_path):
         .. autofunction:: public_function
         """
     )
+
+
+def test_build_preamble_sees_members(test_path):
+    class Documenter(uqbar.apis.ModuleDocumenter):
+        def _build_preamble(self):
+            result = super()._build_preamble()
+            result.extend(["", "{} members".format(len(self.member_documenters))])
+            return result
+
+    documenter = Documenter("fake_package.module")
+    count = len(documenter.member_documenters)
+    assert count
+    assert "{} members".format(count) in str(documenter).splitlines()
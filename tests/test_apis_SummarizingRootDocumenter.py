@@ -1,3 +1,4 @@
+import io
 import pathlib
 import shutil
 import sys
@@ -278,3 +279,26 @@ def test_str_01(test_path):
                multi
             """
         )
+
+
+def test_render_to(test_path):
+    module_documenters = [
+        uqbar.apis.SummarizingModuleDocumenter("fake_package.module"),
+        uqbar.apis.SummarizingModuleDocumenter("fake_package.enums"),
+    ]
+    documenters = [
+        uqbar.apis.RootDocumenter(),
+        uqbar.apis.RootDocumenter(module_documenters=module_documenters),
+        uqbar.apis.SummarizingRootDocumenter(),
+        uqbar.apis.SummarizingRootDocumenter(module_documenters=module_documenters),
+        uqbar.apis.ModuleDocumenter("fake_package.module"),
+        uqbar.apis.ModuleDocumenter(
+            "fake_package",
+            module_documenters=[uqbar.apis.ModuleDocumenter("fake_package.module")],
+        ),
+        *module_documenters,
+    ]
+    for documenter in documenters:
+        stream = io.StringIO()
+        documenter.render_to(stream)
+        assert stream.getvalue() == str(documenter)
@@ -1,13 +1,57 @@
 import importlib
 import pathlib
+import sys
 import types
-from typing import List, MutableMapping, Sequence, Tuple, Type  # noqa
+from collections import defaultdict
+from typing import (  # noqa
+    IO,
+    Callable,
+    DefaultDict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 import uqbar  # noqa
 from uqbar.apis.ClassDocumenter import ClassDocumenter
 from uqbar.apis.FunctionDocumenter import FunctionDocumenter
 from uqbar.apis.MemberDocumenter import MemberDocumenter
 
+_AUTOSUMMARY_HEADER = ("", ".. autosummary::", "   :nosignatures:", "")
+
+_HR_BLOCK = ("", ".. raw:: html", "", "   <hr/>", "")
+
+_TOC_HEADER = ("", ".. toctree::", "")
+
+_HIDDEN_TOC_HEADER = _TOC_HEADER[:2] + ("   :hidden:", "")
+
+_default_member_documenter_classes = (ClassDocumenter, FunctionDocumenter)
+
+
+def _write_lines(lines: Iterable[str], stream: IO[str]) -> None:
+    iterator = iter(lines)
+    stream.write(next(iterator, ""))
+    for line in iterator:
+        stream.write("\n")
+        stream.write(line)
+
+
+def _make_dispatch(
+    member_documenter_classes: Sequence[Type[MemberDocumenter]],
+) -> Callable[[object, str], Optional[Type[MemberDocumenter]]]:
+    validators = tuple((_, _.validate_client) for _ in member_documenter_classes)
+
+    def dispatch(client: object, package_path: str) -> Optional[Type[MemberDocumenter]]:
+        for class_, validate_client in validators:
+            if validate_client(client, package_path):
+                return class_
+        return None
+
+    return dispatch
+
 
 class ModuleDocumenter:
     """
@@ -83,45 +127,82 @@ class ModuleDocumenter:
         module_documenters: Sequence["ModuleDocumenter"] = None,
     ) -> None:
         self._package_path = package_path
-        client = importlib.import_module(package_path)
+        self._package_prefix = package_path + "."
+        # Already-imported modules are served straight from sys.modules,
+        # skipping the import machinery and its lock.
+        client = sys.modules.get(package_path)
+        if client is None:
+            client = importlib.import_module(package_path)
         assert isinstance(client, types.ModuleType)
         self._client = client
+        self._is_package = hasattr(client, "__path__")
+        self._reference_name = package_path.replace("_", "-").replace(".", "--")
+        self._package_name = package_path.rpartition(".")[-1]
+        parts = package_path.split(".")
+        if self._is_package:
+            parts.append("index")
+        elif parts[-1].lower() == "index":
+            parts[-1] = "_" + parts[-1]
+        self._documentation_path = pathlib.Path("/".join(parts) + ".rst")
         self._document_private_members = bool(document_private_members)
         if member_documenter_classes is None:
-            member_documenter_classes = [ClassDocumenter, FunctionDocumenter]
-        for _ in member_documenter_classes:
-            assert issubclass(_, MemberDocumenter), _
+            member_documenter_classes = _default_member_documenter_classes
         self._member_documenter_classes = tuple(member_documenter_classes)
-        if module_documenters is not None:
-            for submodule_documenter in module_documenters:
-                assert isinstance(submodule_documenter, ModuleDocumenter)
-            module_documenters = tuple(module_documenters)
-        self._module_documenters = module_documenters or ()
+        assert all(
+            issubclass(_, MemberDocumenter) for _ in self._member_documenter_classes
+        ), self._member_documenter_classes
+        self._dispatch = _make_dispatch(self._member_documenter_classes)
+        self._module_documenters = tuple(module_documenters or ())
+        assert all(
+            isinstance(_, ModuleDocumenter) for _ in self._module_documenters
+        ), self._module_documenters
         self._member_documenters = self._populate()
+        self._member_documenters_by_section = self._group_by_section()
+        self._preamble_lines = tuple(self._build_preamble())
 
     ### SPECIAL METHODS ###
 
     def __str__(self) -> str:
-        result = self._build_preamble()
+        return "\n".join(self._lines())
+
+    ### PRIVATE METHODS ###
+
+    def _lines(self) -> List[str]:
+        result = list(self._preamble_lines)
         result.extend(self._build_toc(self.module_documenters or []))
         for documenter in self._member_documenters:
-            result.extend(["", str(documenter)])
-        return "\n".join(result)
+            result.append("")
+            result.append(str(documenter))
+        return result
 
-    ### PRIVATE METHODS ###
+    def _group_by_section(self) -> Sequence[Tuple[str, Sequence[MemberDocumenter]]]:
+        result: DefaultDict[str, List[MemberDocumenter]] = defaultdict(list)
+        for documenter in self._sectioned_documenters():
+            result[documenter.documentation_section].append(documenter)
+        return tuple(sorted(result.items()))
+
+    def _sectioned_documenters(self) -> Iterable[MemberDocumenter]:
+        return self.member_documenters
 
     def _populate(self) -> Sequence[MemberDocumenter]:
         documenters = []
-        for name in sorted(dir(self.client)):
-            if name.startswith("_") and not self.document_private_members:
-                continue
-            client = getattr(self.client, name)
-            for class_ in self.member_documenter_classes:
-                if class_.validate_client(client, self.package_path):
-                    path = "{}.{}".format(client.__module__, client.__name__)
-                    documenter = class_(path)
-                    documenters.append(documenter)
-                    break
+        append = documenters.append
+        dispatch = self._dispatch
+        document_private_members = self._document_private_members
+        package_path = self._package_path
+        namespace = self._client.__dict__
+        # Discard private names before touching any member.
+        names = [
+            name
+            for name in namespace
+            if document_private_members or not name.startswith("_")
+        ]
+        names.sort()
+        for name in names:
+            client = namespace[name]
+            class_ = dispatch(client, package_path)
+            if class_ is not None:
+                append(class_(f"{client.__module__}.{client.__name__}"))
         return tuple(documenters)
 
     ### PRIVATE METHODS ###
@@ -130,17 +211,17 @@ class ModuleDocumenter:
         result: List[str] = []
         if not documenters:
             return result
-        result.extend(["", ".. toctree::"])
-        result.append("")
-        module_documenters = [_ for _ in documenters if isinstance(_, type(self))]
-        for module_documenter in module_documenters:
+        result.extend(_TOC_HEADER)
+        for module_documenter in documenters:
             path = self._build_toc_path(module_documenter)
             if path:
                 result.append("   {}".format(path))
         return result
 
     def _build_toc_path(self, documenter):
-        path = documenter.package_path.partition(self.package_path + ".")[-1]
+        prefix = self._package_prefix
+        path = documenter.package_path
+        path = path[len(prefix) :] if path.startswith(prefix) else ""
         base, _, name = path.rpartition(".")
         if name.lower() == "index":
             path = base + "._" + name
@@ -165,6 +246,20 @@ class ModuleDocumenter:
         ]
         return result
 
+    ### PUBLIC METHODS ###
+
+    def render_to(self, stream: IO[str]) -> None:
+        """
+        Write the documenter's reStructuredText output to ``stream``.
+
+        Writes the same text as ``str(documenter)``. The output is still
+        rendered to a list of lines first; only the final join into a single
+        string is avoided.
+
+        :param stream: a writable text stream
+        """
+        _write_lines(self._lines(), stream)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -173,7 +268,7 @@ class ModuleDocumenter:
 
     @property
     def is_package(self) -> bool:
-        return hasattr(self.client, "__path__")
+        return self._is_package
 
     @property
     def document_private_members(self) -> bool:
@@ -181,13 +276,7 @@ class ModuleDocumenter:
 
     @property
     def documentation_path(self) -> pathlib.Path:
-        path = pathlib.Path(".").joinpath(*self.package_path.split("."))
-        if self.is_package:
-            path = path.joinpath("index")
-        elif path.name.lower() == "index":
-            name = path.name
-            path = path.parent.joinpath("_" + name)
-        return path.with_suffix(".rst")
+        return self._documentation_path
 
     @property
     def is_nominative(self) -> bool:
@@ -208,10 +297,7 @@ class ModuleDocumenter:
     def member_documenters_by_section(
         self,
     ) -> Sequence[Tuple[str, Sequence[MemberDocumenter]]]:
-        result: MutableMapping[str, List[MemberDocumenter]] = {}
-        for documenter in self.member_documenters:
-            result.setdefault(documenter.documentation_section, []).append(documenter)
-        return sorted(result.items())
+        return self._member_documenters_by_section
 
     @property
     def module_documenters(self) -> Sequence["ModuleDocumenter"]:
@@ -219,9 +305,7 @@ class ModuleDocumenter:
 
     @property
     def package_name(self) -> str:
-        if "." in self.package_path:
-            return self._package_path.rpartition(".")[-1]
-        return self._package_path
+        return self._package_name
 
     @property
     def package_path(self) -> str:
@@ -229,4 +313,4 @@ class ModuleDocumenter:
 
     @property
     def reference_name(self) -> str:
-        return self.package_path.replace("_", "-").replace(".", "--")
+        return self._reference_name
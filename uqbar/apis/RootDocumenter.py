@@ -1,5 +1,7 @@
 import pathlib
 
+from uqbar.apis.ModuleDocumenter import _write_lines
+
 
 class RootDocumenter:
     """
@@ -67,6 +69,11 @@ class RootDocumenter:
     ### SPECIAL METHODS ###
 
     def __str__(self):
+        return "\n".join(self._lines())
+
+    ### PRIVATE METHODS ###
+
+    def _lines(self):
         result = [self.title, "=" * len(self.title), ""]
         if self.module_documenters:
             result.extend([".. toctree::", ""])
@@ -76,7 +83,19 @@ class RootDocumenter:
                     path = "{}/index".format(path)
                 result.append("   {}".format(path))
             result.append("")
-        return "\n".join(result)
+        return result
+
+    ### PUBLIC METHODS ###
+
+    def render_to(self, stream):
+        """
+        Write ``str(documenter)`` to ``stream``.
+
+        See :py:meth:`~uqbar.apis.ModuleDocumenter.ModuleDocumenter.render_to`.
+
+        :param stream: a writable text stream
+        """
+        _write_lines(self._lines(), stream)
 
     ### PUBLIC PROPERTIES ###
 
@@ -1,7 +1,12 @@
-from typing import List, MutableMapping, Tuple  # noqa
+from typing import Iterable, List  # noqa
 
 from uqbar.apis.MemberDocumenter import MemberDocumenter
-from uqbar.apis.ModuleDocumenter import ModuleDocumenter
+from uqbar.apis.ModuleDocumenter import (
+    _AUTOSUMMARY_HEADER,
+    _HIDDEN_TOC_HEADER,
+    _HR_BLOCK,
+    ModuleDocumenter,
+)
 
 
 class SummarizingModuleDocumenter(ModuleDocumenter):
@@ -101,10 +106,10 @@ class SummarizingModuleDocumenter(ModuleDocumenter):
 
     __documentation_section__ = "Documenters"
 
-    ### SPECIAL METHODS ###
+    ### PRIVATE METHODS ###
 
-    def __str__(self) -> str:
-        result = self._build_preamble()
+    def _lines(self) -> List[str]:
+        result = list(self._preamble_lines)
         package_path = self.package_path.partition(".")[0]
         lineage_path = self.package_path
         result.extend(
@@ -126,31 +131,17 @@ class SummarizingModuleDocumenter(ModuleDocumenter):
                     if _.is_package or not _.is_nominative
                 ]
                 if subpackage_documenters:
+                    result.extend(_HR_BLOCK)
                     result.extend(
-                        [
-                            "",
-                            ".. raw:: html",
-                            "",
-                            "   <hr/>",
-                            "",
-                            ".. rubric:: Subpackages",
-                            "   :class: section-header",
-                        ]
+                        [".. rubric:: Subpackages", "   :class: section-header"]
                     )
                     result.extend(
                         self._build_toc(subpackage_documenters, show_full_paths=True)
                     )
             for section, documenters in self.member_documenters_by_section:
+                result.extend(_HR_BLOCK)
                 result.extend(
-                    [
-                        "",
-                        ".. raw:: html",
-                        "",
-                        "   <hr/>",
-                        "",
-                        ".. rubric:: {}".format(section),
-                        "   :class: section-header",
-                    ]
+                    [".. rubric:: {}".format(section), "   :class: section-header"]
                 )
                 local_documenters = [
                     documenter
@@ -159,10 +150,15 @@ class SummarizingModuleDocumenter(ModuleDocumenter):
                 ]
                 result.extend(self._build_toc(documenters))
                 for local_documenter in local_documenters:
-                    result.extend(["", str(local_documenter)])
-        return "\n".join(result)
+                    result.append("")
+                    result.append(str(local_documenter))
+        return result
 
-    ### PRIVATE METHODS ###
+    def _sectioned_documenters(self) -> Iterable[MemberDocumenter]:
+        yield from self.member_documenters
+        for module_documenter in self.module_documenters or []:
+            if module_documenter.is_nominative:
+                yield module_documenter.member_documenters[0]
 
     def _build_toc(
         self, documenters, show_full_paths: bool = False, **kwargs
@@ -176,28 +172,18 @@ class SummarizingModuleDocumenter(ModuleDocumenter):
             if path:
                 toctree_paths.add(path)
         if toctree_paths:
-            result.extend(["", ".. toctree::", "   :hidden:", ""])
+            result.extend(_HIDDEN_TOC_HEADER)
             for toctree_path in sorted(toctree_paths):
                 result.append("   {}".format(toctree_path))
-        result.extend(["", ".. autosummary::", "   :nosignatures:", ""])
+        result.extend(_AUTOSUMMARY_HEADER)
+        template = "   ~{}"
+        if show_full_paths:
+            template = "   {}"
+        prefix = self._package_prefix
+        prefix_length = len(prefix)
         for documenter in documenters:
-            template = "   ~{}"
-            if show_full_paths:
-                template = "   {}"
-            path = documenter.package_path.rpartition(self.package_path + ".")[-1]
+            path = documenter.package_path
+            if path.startswith(prefix):
+                path = path[prefix_length:]
             result.append(template.format(path))
         return result
-
-    ### PUBLIC PROPERTIES ###
-
-    @property
-    def member_documenters_by_section(self) -> List[Tuple[str, List[MemberDocumenter]]]:
-        result: MutableMapping[str, List[MemberDocumenter]] = {}
-        for documenter in self.member_documenters:
-            result.setdefault(documenter.documentation_section, []).append(documenter)
-        for module_documenter in self.module_documenters or []:
-            if not module_documenter.is_nominative:
-                continue
-            documenter = module_documenter.member_documenters[0]
-            result.setdefault(documenter.documentation_section, []).append(documenter)
-        return sorted(result.items())
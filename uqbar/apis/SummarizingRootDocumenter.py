@@ -1,13 +1,23 @@
+import operator
 import textwrap
 from unittest import mock
 
 from sphinx.ext.autosummary import extract_summary  # type: ignore
 from sphinx.util.docutils import new_document  # type: ignore
 
-from uqbar.apis.ModuleDocumenter import ModuleDocumenter
+from uqbar.apis.ModuleDocumenter import (
+    _AUTOSUMMARY_HEADER,
+    _HIDDEN_TOC_HEADER,
+    _HR_BLOCK,
+    ModuleDocumenter,
+)
 from uqbar.apis.RootDocumenter import RootDocumenter
 from uqbar.strings import normalize
 
+_get_rubric_attrs = operator.attrgetter("package_path", "reference_name")
+
+_get_toc_attrs = operator.attrgetter("package_path", "is_package")
+
 
 class SummarizingRootDocumenter(RootDocumenter):
     """
@@ -96,31 +106,32 @@ class SummarizingRootDocumenter(RootDocumenter):
         documenter directly
     """
 
-    def __str__(self):
-        result = [
-            self.title,
-            "=" * len(self.title),
-            "",
-            ".. toctree::",
-            "   :hidden:",
-            "",
-        ]
-        for documenter in self.module_documenters:
-            path = documenter.package_path.replace(".", "/")
-            if documenter.is_package:
-                path += "/index"
+    ### INITIALIZER ###
+
+    def __init__(self, module_documenters=None, title="API"):
+        super().__init__(module_documenters=module_documenters, title=title)
+        toc_paths, sections = [], []
+        for kind, item in self._walk(self):
+            if kind == "toc":
+                toc_paths.append(item)
+            else:
+                sections.append(item)
+        self._toc_paths = tuple(toc_paths)
+        self._sections = tuple(sections)
+
+    ### PRIVATE METHODS ###
+
+    def _lines(self):
+        result = [self.title, "=" * len(self.title)]
+        result.extend(_HIDDEN_TOC_HEADER)
+        for path in self._toc_paths:
             result.append("   {}".format(path))
-        for module_documenter, documenters_by_section in self._recurse(self):
+        for module_documenter, documenters_by_section in self._sections:
+            package_path, reference_name = _get_rubric_attrs(module_documenter)
+            result.extend(_HR_BLOCK)
             result.extend(
                 [
-                    "",
-                    ".. raw:: html",
-                    "",
-                    "   <hr/>",
-                    "",
-                    ".. rubric:: :ref:`{} <{}>`".format(
-                        module_documenter.package_path, module_documenter.reference_name
-                    ),
+                    ".. rubric:: :ref:`{} <{}>`".format(package_path, reference_name),
                     "   :class: section-header",
                 ]
             )
@@ -128,32 +139,33 @@ class SummarizingRootDocumenter(RootDocumenter):
             if summary:
                 result.extend(["", summary])
             for section_name, documenters in documenters_by_section:
+                result.extend(_HR_BLOCK)
                 result.extend(
                     [
-                        "",
-                        ".. raw:: html",
-                        "",
-                        "   <hr/>",
-                        "",
                         ".. rubric:: {}".format(section_name),
                         "   :class: subsection-header",
-                        "",
-                        ".. autosummary::",
-                        "   :nosignatures:",
-                        "",
                     ]
                 )
+                result.extend(_AUTOSUMMARY_HEADER)
                 for documenter in documenters:
                     result.append("   ~{}".format(documenter.package_path))
-        return "\n".join(result)
+        return result
 
-    def _recurse(self, documenter):
-        result = []
-        if isinstance(documenter, ModuleDocumenter) and not documenter.is_nominative:
-            result.append((documenter, documenter.member_documenters_by_section))
+    def _walk(self, documenter, depth=0):
+        # Yields ("toc", path) for each top-level documenter and
+        # ("section", (documenter, sections)) for each non-nominative module,
+        # in a single depth-first traversal.
+        if isinstance(documenter, ModuleDocumenter):
+            if depth == 1:
+                package_path, is_package = _get_toc_attrs(documenter)
+                path = package_path.replace(".", "/")
+                if is_package:
+                    path += "/index"
+                yield "toc", path
+            if not documenter.is_nominative:
+                yield "section", (documenter, documenter.member_documenters_by_section)
         for module_documenter in documenter.module_documenters:
-            result.extend(self._recurse(module_documenter))
-        return result
+            yield from self._walk(module_documenter, depth + 1)
 
     @classmethod
     def _extract_summary(cls, documenter):